@@ -0,0 +1,138 @@
+"""
+Assignment 1 – Producer-Consumer with asyncio
+
+This program shows the same producer-consumer pattern as `producer_consumer.py`,
+but with coroutines on a single event loop instead of OS threads.
+Handing an item from producer to consumer is a task switch inside the loop,
+so no thread wakeups go through the kernel.
+"""
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Generic, Iterable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncBoundedBuffer(Generic[T]):
+    """A bounded queue for coroutines, mirroring BoundedBuffer with asyncio Conditions."""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._buf: Deque[T] = deque()
+        self._lock = asyncio.Lock()
+        self._not_empty = asyncio.Condition(self._lock)
+        self._not_full = asyncio.Condition(self._lock)
+        self._closed = False
+        self._close_task: Optional[asyncio.Task] = None
+
+    async def put(self, item: T) -> None:
+        """Add an item to the buffer, waiting if it’s full."""
+        if self._closed:
+            raise RuntimeError("Cannot put into closed buffer")
+        async with self._not_full:
+            while len(self._buf) >= self._maxsize:
+                if self._closed:
+                    raise RuntimeError("Cannot put into closed buffer")
+                await self._not_full.wait()
+            # Re-check after waking: close() may have run while we waited.
+            if self._closed:
+                raise RuntimeError("Cannot put into closed buffer")
+            self._buf.append(item)
+            self._not_empty.notify()
+
+    async def get(self) -> Optional[T]:
+        """Remove and return an item, waiting if the buffer is empty."""
+        async with self._not_empty:
+            while not self._buf:
+                if self._closed:
+                    return None
+                await self._not_empty.wait()
+            item = self._buf.popleft()
+            self._not_full.notify()
+            return item
+
+    def close(self) -> None:
+        """Close the buffer and wake all waiting producers and consumers."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # without a running loop nothing can be parked in wait()
+        # Notifying needs the lock, so hand it to a task; the flag is already set,
+        # so every coroutine that wakes sees the buffer as closed.
+        self._close_task = loop.create_task(self._wake_all())
+
+    async def _wake_all(self) -> None:
+        async with self._lock:
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+
+@dataclass
+class AsyncProducer(Generic[T]):
+    """Produces items from a source iterable and adds them to the buffer."""
+    source: Iterable[T]
+    buffer: AsyncBoundedBuffer[T]
+
+    async def run(self) -> None:
+        for item in self.source:
+            await self.buffer.put(item)
+        # The buffer will be closed externally after all producers finish.
+
+
+@dataclass
+class AsyncConsumer(Generic[T]):
+    """Consumes items from the buffer until it is closed."""
+    buffer: AsyncBoundedBuffer[T]
+    dest: List[T] = field(default_factory=list)
+
+    async def run(self) -> None:
+        while True:
+            item = await self.buffer.get()
+            if item is None:
+                break
+            self.dest.append(item)
+
+
+async def run_producers(producers: List[AsyncProducer], buffer: AsyncBoundedBuffer) -> None:
+    """Run all producers to completion, then close their shared buffer."""
+    await asyncio.gather(*(p.run() for p in producers))
+    buffer.close()
+
+
+async def run_scenario(name: str, data: list) -> None:
+    """Run a simple producer-consumer scenario with one producer and one consumer."""
+    buf = AsyncBoundedBuffer(maxsize=10)
+    consumer = AsyncConsumer(buffer=buf)
+    producer = AsyncProducer(source=data, buffer=buf)
+
+    await asyncio.gather(run_producers([producer], buf), consumer.run())
+
+    print(f"{name}: produced={len(data)}, consumed={len(consumer.dest)}")
+
+
+async def demo_fast() -> None:
+    """Demonstrates a few data types and a multi-producer scenario."""
+    print("=== Async Producer-Consumer Demo ===")
+
+    await run_scenario("Dict Data", [{"id": i} for i in range(20)])
+    await run_scenario("Tuple Data", [(i, f"task-{i}") for i in range(20)])
+
+    print("\n--- Multi-Producer Test ---")
+    chunks = [list(range(i * 10, (i + 1) * 10)) for i in range(3)]
+    buf = AsyncBoundedBuffer[int](maxsize=5)
+    consumer = AsyncConsumer[int](buffer=buf)
+    producers = [AsyncProducer[int](source=chunk, buffer=buf) for chunk in chunks]
+
+    await asyncio.gather(run_producers(producers, buf), consumer.run())
+
+    total_produced = sum(len(chunk) for chunk in chunks)
+    print(f"Total produced: {total_produced}, consumed: {len(consumer.dest)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(demo_fast())
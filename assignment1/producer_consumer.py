@@ -8,52 +8,151 @@ The design supports multiple producers and consumers and runs quickly without us
 """
 
 import threading
-from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Deque, Generic, Iterable, List, Optional, TypeVar
+from itertools import islice
+from typing import Generic, Iterable, List, Optional, TypeVar
 
 T = TypeVar("T")
 
 
 class BoundedBuffer(Generic[T]):
-    """A simple thread-safe bounded queue using Conditions for synchronization."""
+    """A thread-safe bounded queue backed by a fixed-size ring of slots."""
 
     def __init__(self, maxsize: int):
         self._maxsize = maxsize
-        self._buf: Deque[T] = deque()
+        # Preallocated ring storage: items live in [head, head + count).
+        # The ring is rounded up to a power of two so wrapping is a bitmask;
+        # _maxsize still bounds how many slots may be occupied.
+        self._capacity = 1 << max(maxsize - 1, 0).bit_length()
+        self._mask = self._capacity - 1
+        self._slots: List[Optional[T]] = [None] * self._capacity
+        self._head = 0
+        self._count = 0
         self._lock = threading.Lock()
         self._not_empty = threading.Condition(self._lock)
         self._not_full = threading.Condition(self._lock)
         self._closed = False
+        # Threads currently blocked in wait(); guarded by self._lock so
+        # put/get can skip notify() when nobody is listening.
+        self._waiters_not_empty = 0
+        self._waiters_not_full = 0
+
+    def _wait_for_room(self) -> None:
+        """Block until there is free space; the caller must hold the lock."""
+        while self._count >= self._maxsize:
+            if self._closed:
+                raise RuntimeError("Cannot put into closed buffer")
+            self._waiters_not_full += 1
+            try:
+                self._not_full.wait()
+            finally:
+                self._waiters_not_full -= 1
+        if self._closed:
+            raise RuntimeError("Cannot put into closed buffer")
+
+    def _wait_for_item(self) -> bool:
+        """Block until an item is available; return False once closed and drained."""
+        while not self._count:
+            if self._closed:
+                return False
+            self._waiters_not_empty += 1
+            try:
+                self._not_empty.wait()
+            finally:
+                self._waiters_not_empty -= 1
+        return True
+
+    def _pop(self) -> T:
+        """Take the oldest item, clearing its slot; the caller must hold the lock."""
+        head = self._head
+        item = self._slots[head]
+        self._slots[head] = None  # drop the buffer's reference
+        self._head = (head + 1) & self._mask
+        self._count -= 1
+        return item
+
+    def _pop_many(self, n: int) -> List[T]:
+        """Take the n oldest items with at most two slice copies around the wrap point."""
+        slots, head = self._slots, self._head
+        first = min(n, self._capacity - head)
+        batch = slots[head:head + first]
+        slots[head:head + first] = [None] * first
+        rest = n - first
+        if rest:
+            batch += slots[:rest]
+            slots[:rest] = [None] * rest
+        self._head = (head + n) & self._mask
+        self._count -= n
+        return batch
 
     def put(self, item: T) -> None:
         """Add an item to the buffer, waiting if it’s full."""
+        # Fail fast without touching the lock once the buffer is closed.
+        if self._closed:
+            raise RuntimeError("Cannot put into closed buffer")
         with self._not_full:
-            while len(self._buf) >= self._maxsize and not self._closed:
-                self._not_full.wait()
-            if self._closed:
-                raise RuntimeError("Cannot put into closed buffer")
-            self._buf.append(item)
-            self._not_empty.notify()
+            self._wait_for_room()
+            self._slots[(self._head + self._count) & self._mask] = item
+            self._count += 1
+            if self._waiters_not_empty:
+                self._not_empty.notify()
+
+    def put_many(self, items: Iterable[T]) -> None:
+        """Add several items, filling as much free space as possible per lock hold."""
+        if self._closed:
+            raise RuntimeError("Cannot put into closed buffer")
+        items = list(items)
+        slots, capacity = self._slots, self._capacity
+        i, n = 0, len(items)
+        with self._not_full:
+            while i < n:
+                self._wait_for_room()
+                added = min(self._maxsize - self._count, n - i)
+                # Copy the run into the ring with at most two slice assignments.
+                tail = (self._head + self._count) & self._mask
+                first = min(added, capacity - tail)
+                slots[tail:tail + first] = items[i:i + first]
+                if added > first:
+                    slots[:added - first] = items[i + first:i + added]
+                self._count += added
+                i += added
+                if self._waiters_not_empty:
+                    self._not_empty.notify(min(added, self._waiters_not_empty))
 
     def get(self) -> Optional[T]:
         """Remove and return an item, waiting if the buffer is empty."""
         with self._not_empty:
-            while True:
-                if self._buf:
-                    item = self._buf.popleft()
-                    self._not_full.notify()
-                    return item
-                if self._closed:
-                    return None
-                self._not_empty.wait()
+            if not self._wait_for_item():
+                return None
+            item = self._pop()
+            if self._waiters_not_full:
+                self._not_full.notify()
+            return item
+
+    def get_batch(self, max_n: int = 64) -> List[T]:
+        """Remove up to max_n items at once; return an empty list once closed and drained."""
+        if max_n < 1:
+            raise ValueError("max_n must be at least 1")
+        with self._not_empty:
+            if not self._wait_for_item():
+                return []
+            n = min(max_n, self._count)
+            batch = self._pop_many(n)
+            if self._waiters_not_full:
+                self._not_full.notify(min(n, self._waiters_not_full))
+            return batch
 
     def close(self) -> None:
-        """Close the buffer and wake all waiting threads."""
+        """Close the buffer and wake any threads blocked on it."""
         with self._lock:
             self._closed = True
-            self._not_empty.notify_all()
-            self._not_full.notify_all()
+            # Only the threads actually parked in wait() need waking; each
+            # re-checks _closed once and returns (consumers) or raises (producers).
+            if self._waiters_not_empty:
+                self._not_empty.notify(self._waiters_not_empty)
+            if self._waiters_not_full:
+                self._not_full.notify(self._waiters_not_full)
 
 
 @dataclass
@@ -61,10 +160,17 @@ class Producer(Generic[T]):
     """Produces items from a source iterable and adds them to the buffer."""
     source: Iterable[T]
     buffer: BoundedBuffer[T]
+    batch_size: int = 64
+
+    def __post_init__(self):
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
 
     def run(self) -> None:
-        for item in self.source:
-            self.buffer.put(item)
+        # Hand items over in batches so each lock acquisition moves many items.
+        it = iter(self.source)
+        while batch := list(islice(it, self.batch_size)):
+            self.buffer.put_many(batch)
         # The buffer will be closed externally after all producers finish.
 
 
@@ -73,13 +179,24 @@ class Consumer(Generic[T]):
     """Consumes items from the buffer until it is closed."""
     buffer: BoundedBuffer[T]
     dest: List[T] = field(default_factory=list)
+    batch_size: int = 64
+
+    def __post_init__(self):
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
 
     def run(self) -> None:
         while True:
-            item = self.buffer.get()
-            if item is None:
+            batch = self.buffer.get_batch(self.batch_size)
+            if not batch:
                 break
-            self.dest.append(item)
+            self.dest.extend(batch)
+
+
+# Worker threads shared by every scenario, so each run reuses threads instead of
+# creating new ones. A scenario must not need more concurrent producers and
+# consumers than max_workers.
+_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="producer-consumer")
 
 
 def run_scenario(name: str, data: list):
@@ -88,14 +205,16 @@ def run_scenario(name: str, data: list):
     consumer = Consumer(buffer=buf)
     producer = Producer(source=data, buffer=buf)
 
-    t_prod = threading.Thread(target=producer.run)
-    t_cons = threading.Thread(target=consumer.run)
-    t_prod.start()
-    t_cons.start()
+    f_prod = _POOL.submit(producer.run)
+    f_cons = _POOL.submit(consumer.run)
 
-    t_prod.join()
-    buf.close()  # Close the buffer after producer finishes
-    t_cons.join()
+    try:
+        f_prod.result()
+    finally:
+        # Close even if the producer failed, or the consumer would stay parked
+        # on a pool worker and block interpreter exit.
+        buf.close()
+        f_cons.result()
 
     print(f"{name}: produced={len(data)}, consumed={len(consumer.dest)}")
 
@@ -135,17 +254,15 @@ def demo_fast():
     consumer = Consumer[int](buffer=buf)
     producers = [Producer[int](source=chunk, buffer=buf) for chunk in chunks]
 
-    prod_threads = [threading.Thread(target=p.run) for p in producers]
-    cons_thread = threading.Thread(target=consumer.run)
-
-    for t in prod_threads:
-        t.start()
-    cons_thread.start()
+    prod_futures = [_POOL.submit(p.run) for p in producers]
+    cons_future = _POOL.submit(consumer.run)
 
-    for t in prod_threads:
-        t.join()
-    buf.close()
-    cons_thread.join()
+    try:
+        for f in prod_futures:
+            f.result()
+    finally:
+        buf.close()
+        cons_future.result()
 
     total_produced = sum(len(chunk) for chunk in chunks)
     print(f"Total produced: {total_produced}, consumed: {len(consumer.dest)}")
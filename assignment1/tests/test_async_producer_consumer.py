@@ -0,0 +1,116 @@
+"""
+Assignment 1 – Unit Tests for the asyncio Producer–Consumer
+
+This file contains unit tests that verify the behavior of the
+coroutine-based implementation in `assignment1/async_producer_consumer.py`.
+"""
+
+import asyncio
+import time
+import unittest
+from assignment1.async_producer_consumer import (
+    AsyncBoundedBuffer, AsyncProducer, AsyncConsumer, run_producers
+)
+
+
+class TestAsyncProducerConsumer(unittest.TestCase):
+    """Unit tests for the asyncio Producer–Consumer system."""
+
+    def test_basic_roundtrip(self):
+        """Single producer and single consumer transfer data in order."""
+        async def scenario():
+            data = list(range(100))
+            buf = AsyncBoundedBuffer[int](maxsize=10)
+            consumer = AsyncConsumer[int](buffer=buf)
+            producer = AsyncProducer[int](source=data, buffer=buf)
+            await asyncio.gather(run_producers([producer], buf), consumer.run())
+            return data, consumer.dest
+
+        data, dest = asyncio.run(scenario())
+        self.assertEqual(dest, data)
+
+    def test_put_after_close_raises(self):
+        """Adding to a closed buffer should raise an exception."""
+        async def scenario():
+            buf = AsyncBoundedBuffer[int](maxsize=2)
+            buf.close()
+            await buf.put(1)
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(scenario())
+
+    def test_close_right_after_put_wakes_all_consumers(self):
+        """Closing directly after a put still releases every parked consumer."""
+        async def scenario():
+            buf = AsyncBoundedBuffer[int](maxsize=4)
+            consumers = [AsyncConsumer[int](buffer=buf) for _ in range(3)]
+            tasks = [asyncio.create_task(c.run()) for c in consumers]
+            await asyncio.sleep(0)  # let every consumer park on the empty buffer
+            await buf.put(1)
+            buf.close()
+            await asyncio.wait_for(asyncio.gather(*tasks), timeout=1.0)
+            return [c.dest for c in consumers]
+
+        dests = asyncio.run(scenario())
+        self.assertEqual(sorted(x for d in dests for x in d), [1])
+
+    def test_close_fails_blocked_producer(self):
+        """A producer waiting on a full buffer raises once the buffer is closed."""
+        async def scenario():
+            buf = AsyncBoundedBuffer[int](maxsize=1)
+            await buf.put(0)
+            blocked = asyncio.create_task(buf.put(1))
+            await asyncio.sleep(0)
+            buf.close()
+            consumer = AsyncConsumer[int](buffer=buf)
+            await asyncio.wait_for(consumer.run(), timeout=1.0)
+            with self.assertRaises(RuntimeError):
+                await asyncio.wait_for(blocked, timeout=1.0)
+            return consumer.dest
+
+        self.assertEqual(asyncio.run(scenario()), [0])
+
+    def test_multiple_producers_and_consumers(self):
+        """All items arrive exactly once and every waiting consumer exits on close."""
+        async def scenario():
+            chunks = [list(range(i * 50, (i + 1) * 50)) for i in range(3)]
+            buf = AsyncBoundedBuffer[int](maxsize=5)
+            consumers = [AsyncConsumer[int](buffer=buf) for _ in range(3)]
+            producers = [AsyncProducer[int](source=c, buffer=buf) for c in chunks]
+            await asyncio.gather(
+                run_producers(producers, buf), *(c.run() for c in consumers)
+            )
+            return sorted(x for c in consumers for x in c.dest)
+
+        self.assertEqual(asyncio.run(scenario()), list(range(150)))
+
+    def test_performance_multi_producer(self):
+        """Benchmark: multiple producers writing to one buffer."""
+        producers_count = 4
+        items_per_producer = 2500
+        total = producers_count * items_per_producer
+
+        async def scenario():
+            buf = AsyncBoundedBuffer[int](maxsize=100)
+            consumer = AsyncConsumer[int](buffer=buf)
+            producers = [
+                AsyncProducer[int](
+                    source=range(i * items_per_producer, (i + 1) * items_per_producer),
+                    buffer=buf,
+                )
+                for i in range(producers_count)
+            ]
+            await asyncio.gather(run_producers(producers, buf), consumer.run())
+            return consumer.dest
+
+        start = time.time()
+        dest = asyncio.run(scenario())
+        duration = time.time() - start
+        print(f"\n[PERF] Async Multi-Producer: {total} items in {duration:.3f}s ({total / duration:.1f} items/sec)")
+
+        self.assertEqual(len(dest), total)
+        self.assertLess(duration, 5.0, "Async multi-producer too slow (>5s)")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -8,15 +8,24 @@ ordering, and performance.
 """
 
 import unittest
-import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from dataclasses import dataclass
-from assignment1.producer_consumer import BoundedBuffer, Producer, Consumer
+from assignment1.producer_consumer import BoundedBuffer, Producer, Consumer, run_scenario
 
 
 class TestProducerConsumer(unittest.TestCase):
     """Unit tests for the Producer–Consumer system."""
 
+    @classmethod
+    def setUpClass(cls):
+        # One set of worker threads reused by every test in the class.
+        cls.pool = ThreadPoolExecutor(max_workers=8)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown(wait=True)
+
     def test_basic_roundtrip(self):
         """Single producer and single consumer transfer data correctly."""
         data = list(range(100))
@@ -24,13 +33,13 @@ class TestProducerConsumer(unittest.TestCase):
         consumer = Consumer[int](buffer=buf)
         producer = Producer[int](source=data, buffer=buf)
 
-        t_prod = threading.Thread(target=producer.run)
-        t_cons = threading.Thread(target=consumer.run)
-        t_prod.start()
-        t_cons.start()
-        t_prod.join()
-        buf.close()
-        t_cons.join()
+        f_prod = self.pool.submit(producer.run)
+        f_cons = self.pool.submit(consumer.run)
+        try:
+            f_prod.result()
+        finally:
+            buf.close()
+            f_cons.result()
 
         self.assertEqual(consumer.dest, data)
 
@@ -40,9 +49,11 @@ class TestProducerConsumer(unittest.TestCase):
         result = []
 
         def producer_task():
-            for i in range(5):
-                buf.put(i)
-            buf.close()
+            try:
+                for i in range(5):
+                    buf.put(i)
+            finally:
+                buf.close()
 
         def consumer_task():
             while True:
@@ -51,12 +62,10 @@ class TestProducerConsumer(unittest.TestCase):
                     break
                 result.append(item)
 
-        t1 = threading.Thread(target=producer_task)
-        t2 = threading.Thread(target=consumer_task)
-        t1.start()
-        t2.start()
-        t1.join()
-        t2.join()
+        f1 = self.pool.submit(producer_task)
+        f2 = self.pool.submit(consumer_task)
+        f1.result()
+        f2.result()
 
         self.assertEqual(result, list(range(5)))
 
@@ -78,13 +87,13 @@ class TestProducerConsumer(unittest.TestCase):
         consumer = Consumer(buffer=buf)
         producer = Producer(source=data, buffer=buf)
 
-        t1 = threading.Thread(target=producer.run)
-        t2 = threading.Thread(target=consumer.run)
-        t1.start()
-        t2.start()
-        t1.join()
-        buf.close()
-        t2.join()
+        f1 = self.pool.submit(producer.run)
+        f2 = self.pool.submit(consumer.run)
+        try:
+            f1.result()
+        finally:
+            buf.close()
+            f2.result()
 
         self.assertEqual(consumer.dest, data)
 
@@ -95,6 +104,33 @@ class TestProducerConsumer(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             buf.put(1)
 
+    def test_close_wakes_blocked_threads(self):
+        """Closing releases waiting consumers with None and waiting producers with an error."""
+        empty = BoundedBuffer[int](maxsize=2)
+        consumers = [self.pool.submit(empty.get) for _ in range(3)]
+
+        full = BoundedBuffer[int](maxsize=1)
+        full.put(0)
+        producer = self.pool.submit(full.put, 1)
+
+        time.sleep(0.05)
+        empty.close()
+        full.close()
+
+        self.assertEqual([f.result(timeout=1.0) for f in consumers], [None, None, None])
+        with self.assertRaises(RuntimeError):
+            producer.result(timeout=1.0)
+        self.assertEqual(full.get(), 0)
+
+    def test_failing_producer_still_releases_consumer(self):
+        """A producer error propagates instead of leaving the consumer parked forever."""
+        def failing_source():
+            yield from range(3)
+            raise ValueError("source failed")
+
+        with self.assertRaises(ValueError):
+            run_scenario("Failing Source", failing_source())
+
     def test_multiple_producers(self):
         """Multiple producers can safely share the same buffer."""
         chunks = [list(range(i * 10, (i + 1) * 10)) for i in range(3)]
@@ -102,16 +138,15 @@ class TestProducerConsumer(unittest.TestCase):
         consumer = Consumer[int](buffer=buf)
         producers = [Producer[int](source=c, buffer=buf) for c in chunks]
 
-        prod_threads = [threading.Thread(target=p.run) for p in producers]
-        cons_thread = threading.Thread(target=consumer.run)
+        prod_futures = [self.pool.submit(p.run) for p in producers]
+        cons_future = self.pool.submit(consumer.run)
 
-        for t in prod_threads:
-            t.start()
-        cons_thread.start()
-        for t in prod_threads:
-            t.join()
-        buf.close()
-        cons_thread.join()
+        try:
+            for f in prod_futures:
+                f.result()
+        finally:
+            buf.close()
+            cons_future.result()
 
         total_produced = sum(len(c) for c in chunks)
         self.assertEqual(len(consumer.dest), total_produced)
@@ -125,16 +160,15 @@ class TestProducerConsumer(unittest.TestCase):
         consumer2 = Consumer[int](buffer=buf)
         producer = Producer[int](source=data, buffer=buf)
 
-        t_prod = threading.Thread(target=producer.run)
-        t_c1 = threading.Thread(target=consumer1.run)
-        t_c2 = threading.Thread(target=consumer2.run)
-        t_prod.start()
-        t_c1.start()
-        t_c2.start()
-        t_prod.join()
-        buf.close()
-        t_c1.join()
-        t_c2.join()
+        f_prod = self.pool.submit(producer.run)
+        f_c1 = self.pool.submit(consumer1.run)
+        f_c2 = self.pool.submit(consumer2.run)
+        try:
+            f_prod.result()
+        finally:
+            buf.close()
+            f_c1.result()
+            f_c2.result()
 
         total_consumed = len(consumer1.dest) + len(consumer2.dest)
         self.assertEqual(total_consumed, len(data))
@@ -148,13 +182,13 @@ class TestProducerConsumer(unittest.TestCase):
         consumer = Consumer[int](buffer=buf)
         producer = Producer[int](source=data, buffer=buf)
 
-        t_prod = threading.Thread(target=producer.run)
-        t_cons = threading.Thread(target=consumer.run)
-        t_prod.start()
-        t_cons.start()
-        t_prod.join()
-        buf.close()
-        t_cons.join()
+        f_prod = self.pool.submit(producer.run)
+        f_cons = self.pool.submit(consumer.run)
+        try:
+            f_prod.result()
+        finally:
+            buf.close()
+            f_cons.result()
 
         self.assertEqual(consumer.dest, data)
 
@@ -167,25 +201,92 @@ class TestProducerConsumer(unittest.TestCase):
         p1 = Producer[int](source=[1, 2, 3], buffer=b1)
         p2 = Producer[int](source=[10, 20, 30], buffer=b2)
 
-        threads = [
-            threading.Thread(target=p1.run),
-            threading.Thread(target=p2.run),
-            threading.Thread(target=c1.run),
-            threading.Thread(target=c2.run),
-        ]
+        futures = [self.pool.submit(task) for task in (p1.run, p2.run, c1.run, c2.run)]
 
-        for t in threads:
-            t.start()
-        threads[0].join()
-        b1.close()
-        threads[1].join()
-        b2.close()
-        threads[2].join()
-        threads[3].join()
+        try:
+            futures[0].result()
+        finally:
+            b1.close()
+            try:
+                futures[1].result()
+            finally:
+                b2.close()
+                futures[2].result()
+                futures[3].result()
 
         self.assertEqual(c1.dest, [1, 2, 3])
         self.assertEqual(c2.dest, [10, 20, 30])
 
+    def test_put_many_and_get_batch(self):
+        """Batch operations move many items per call and keep FIFO order."""
+        data = list(range(200))
+        buf = BoundedBuffer[int](maxsize=7)
+        result = []
+        batch_sizes = []
+
+        def consumer_task():
+            while True:
+                batch = buf.get_batch(16)
+                if not batch:
+                    break
+                batch_sizes.append(len(batch))
+                result.extend(batch)
+
+        f_cons = self.pool.submit(consumer_task)
+        try:
+            buf.put_many(data)
+        finally:
+            buf.close()
+            f_cons.result()
+
+        self.assertEqual(result, data)
+        self.assertTrue(batch_sizes)
+        self.assertLessEqual(max(batch_sizes), 16)
+
+    def test_get_batch_after_close_returns_empty(self):
+        """A drained, closed buffer returns an empty batch instead of blocking."""
+        buf = BoundedBuffer[int](maxsize=4)
+        buf.put_many([1, 2])
+        buf.close()
+        self.assertEqual(buf.get_batch(), [1, 2])
+        self.assertEqual(buf.get_batch(), [])
+        with self.assertRaises(RuntimeError):
+            buf.put_many([3])
+
+    def test_invalid_batch_sizes_raise(self):
+        """Non-positive batch sizes are rejected instead of dropping data or corrupting the ring."""
+        buf = BoundedBuffer[int](maxsize=4)
+        buf.put_many([1, 2])
+        for bad in (0, -1):
+            with self.assertRaises(ValueError):
+                buf.get_batch(bad)
+            with self.assertRaises(ValueError):
+                Producer[int](source=[3], buffer=buf, batch_size=bad)
+            with self.assertRaises(ValueError):
+                Consumer[int](buffer=buf, batch_size=bad)
+        self.assertEqual(buf.get_batch(), [1, 2])
+
+    def test_non_power_of_two_maxsize(self):
+        """The ring wraps correctly and still blocks at the requested bound."""
+        buf = BoundedBuffer[int](maxsize=5)
+        result = []
+        for start in range(0, 60, 4):
+            buf.put_many(range(start, start + 4))
+            result.extend(buf.get_batch(3))
+            result.append(buf.get())
+        self.assertEqual(result, list(range(60)))
+
+        buf.put_many(range(5))
+        f = self.pool.submit(buf.put, 5)
+        try:
+            with self.assertRaises(FutureTimeout, msg="put should block once maxsize items are buffered"):
+                f.result(timeout=0.05)
+            self.assertEqual(buf.get(), 0)
+            f.result()
+            self.assertEqual(buf.get_batch(), [1, 2, 3, 4, 5])
+        finally:
+            buf.close()  # never leave the put parked on a shared worker
+
     def test_performance_single_producer(self):
         """Benchmark: single producer and consumer throughput."""
         N = 10000
@@ -194,13 +295,13 @@ class TestProducerConsumer(unittest.TestCase):
         producer = Producer[int](source=list(range(N)), buffer=buf)
 
         start = time.time()
-        t_prod = threading.Thread(target=producer.run)
-        t_cons = threading.Thread(target=consumer.run)
-        t_prod.start()
-        t_cons.start()
-        t_prod.join()
-        buf.close()
-        t_cons.join()
+        f_prod = self.pool.submit(producer.run)
+        f_cons = self.pool.submit(consumer.run)
+        try:
+            f_prod.result()
+        finally:
+            buf.close()
+            f_cons.result()
         end = time.time()
 
         duration = end - start
@@ -224,17 +325,15 @@ class TestProducerConsumer(unittest.TestCase):
         ]
         producers = [Producer[int](source=c, buffer=buf) for c in chunks]
 
-        threads = [threading.Thread(target=p.run) for p in producers]
-        cons_thread = threading.Thread(target=consumer.run)
-
         start = time.time()
-        for t in threads:
-            t.start()
-        cons_thread.start()
-        for t in threads:
-            t.join()
-        buf.close()
-        cons_thread.join()
+        prod_futures = [self.pool.submit(p.run) for p in producers]
+        cons_future = self.pool.submit(consumer.run)
+        try:
+            for f in prod_futures:
+                f.result()
+        finally:
+            buf.close()
+            cons_future.result()
         end = time.time()
 
         duration = end - start
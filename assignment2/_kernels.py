@@ -0,0 +1,43 @@
+"""
+Assignment 2 – Compiled aggregation kernel
+
+Numba-compiled loop that computes every report aggregate in a single sweep
+over the column arrays built by `sales_frame.full_report()`. Group keys come in
+as integer codes, so each accumulator is a plain float64 array indexed by code.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def aggregate(qty, price, disc, region_id, cat_id, prod_id, month_id, order_id,
+              n_region, n_cat, n_prod, n_month, n_order):
+    """Return (total, by_region, by_cat, by_prod, by_month, disc_sum_by_cat,
+    count_by_cat, best_order, best_order_value) for the given column arrays."""
+    rev_by_region = np.zeros(n_region)
+    rev_by_cat = np.zeros(n_cat)
+    rev_by_prod = np.zeros(n_prod)
+    rev_by_month = np.zeros(n_month)
+    disc_sum_by_cat = np.zeros(n_cat)
+    count_by_cat = np.zeros(n_cat, dtype=np.int64)
+    rev_by_order = np.zeros(n_order)
+    total = 0.0
+    for i in range(qty.shape[0]):
+        rev = qty[i] * price[i] * (1.0 - disc[i])
+        total += rev
+        rev_by_region[region_id[i]] += rev
+        rev_by_cat[cat_id[i]] += rev
+        rev_by_prod[prod_id[i]] += rev
+        rev_by_month[month_id[i]] += rev
+        disc_sum_by_cat[cat_id[i]] += disc[i]
+        count_by_cat[cat_id[i]] += 1
+        rev_by_order[order_id[i]] += rev
+
+    # First order with the largest value, matching max() on the Python side.
+    best = 0
+    for j in range(1, n_order):
+        if rev_by_order[j] > rev_by_order[best]:
+            best = j
+    return (total, rev_by_region, rev_by_cat, rev_by_prod, rev_by_month,
+            disc_sum_by_cat, count_by_cat, best, rev_by_order[best])
@@ -0,0 +1,23 @@
+"""
+Assignment 2 – Report container
+
+Holds the SalesReport dataclass shared by the list-based `sales_analysis` and the
+DataFrame-based `sales_frame` modules. It lives on its own so neither module has
+to import the other's dependencies (matplotlib, numba) just to build a report.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+
+@dataclass(slots=True)
+class SalesReport:
+    """All report aggregates, computed together by full_report()."""
+    records: int
+    total_revenue: float
+    revenue_by_region: Dict[str, float]
+    revenue_by_category: Dict[str, float]
+    top_products: List[Tuple[str, float]]
+    monthly_trend: Dict[str, float]
+    average_discount: Dict[str, float]
+    highest_order: Tuple[str, float]
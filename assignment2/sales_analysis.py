@@ -7,16 +7,22 @@ trends, and plots a monthly revenue chart using Matplotlib.
 """
 
 import csv
-from dataclasses import dataclass
-from typing import List, Dict, Tuple
+import heapq
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Tuple
 from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
 from datetime import datetime
 from pathlib import Path
 import matplotlib.pyplot as plt
 
+from assignment2.report import SalesReport
+
 
 # Data model
-@dataclass
+@dataclass(slots=True)
 class Sale:
     """Represents a single sale record."""
     order_id: str
@@ -28,41 +34,89 @@ class Sale:
     quantity: int
     unit_price: float
     discount: float
+    # Derived values, computed once when the record is created.
+    revenue: float = field(init=False)
+    month_key: int = field(init=False)  # year * 100 + month, e.g. 202401
+
+    def __post_init__(self):
+        self.revenue = self.quantity * self.unit_price * (1 - self.discount)
+        self.month_key = self.date.year * 100 + self.date.month
+
 
-    @property
-    def revenue(self) -> float:
-        """Return the revenue for this sale after applying discount."""
-        return self.quantity * self.unit_price * (1 - self.discount)
+def _month_label(key: int) -> str:
+    """Format a month_key as YYYY-MM."""
+    return f"{key // 100:04d}-{key % 100:02d}"
 
 
 # Reading the CSV file
-def read_sales(csv_path: str) -> List[Sale]:
-    """Load sales data from a CSV file into a list of Sale objects."""
+def _parse_date(text: str) -> datetime:
+    """Parse a fixed-layout YYYY-MM-DD date without going through strptime."""
+    return datetime(int(text[:4]), int(text[5:7]), int(text[8:10]))
+
+
+def _iter_rows(csv_path: str) -> Iterator[tuple]:
+    """Yield each CSV row as a tuple of converted Sale constructor arguments."""
     with open(csv_path, newline="") as f:
-        reader = csv.DictReader(f)
-        return [
-            Sale(
-                order_id=row["order_id"],
-                date=datetime.strptime(row["date"], "%Y-%m-%d"),
-                region=row["region"],
-                category=row["category"],
-                product=row["product"],
-                customer=row["customer"],
-                quantity=int(row["quantity"]),
-                unit_price=float(row["unit_price"]),
-                discount=float(row["discount"]),
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        # Resolve column positions once from the header, then index rows as lists.
+        col = {name: i for i, name in enumerate(header)}
+        i_oid, i_date, i_region, i_cat, i_prod, i_cust, i_qty, i_price, i_disc = (
+            col["order_id"], col["date"], col["region"], col["category"],
+            col["product"], col["customer"], col["quantity"], col["unit_price"],
+            col["discount"],
+        )
+        for row in reader:
+            if not row:
+                continue  # blank line; DictReader skipped these too
+            yield (
+                row[i_oid],
+                _parse_date(row[i_date]),
+                row[i_region],
+                row[i_cat],
+                row[i_prod],
+                row[i_cust],
+                int(row[i_qty]),
+                float(row[i_price]),
+                float(row[i_disc]),
             )
-            for row in reader
-        ]
+
+
+def iter_sales(csv_path: str) -> Iterator[Sale]:
+    """Stream Sale objects from a CSV file one row at a time."""
+    for fields in _iter_rows(csv_path):
+        yield Sale(*fields)
+
+
+@lru_cache(maxsize=4)
+def _load_rows(csv_path: str, mtime_ns: int, size: int) -> Tuple[tuple, ...]:
+    """Parse a CSV once per (path, mtime, size); a changed file gets a new entry."""
+    return tuple(_iter_rows(csv_path))
+
+
+def read_sales(csv_path: str) -> List[Sale]:
+    """Load sales data from a CSV file into a list of Sale objects.
+
+    The parsed (immutable) field values are cached until the file changes; each
+    call builds fresh Sale objects, so callers may modify what they get back.
+    """
+    st = os.stat(csv_path)
+    return [Sale(*fields) for fields in _load_rows(csv_path, st.st_mtime_ns, st.st_size)]
 
 
 # Analysis functions
-def total_revenue(data: List[Sale]) -> float:
+def total_revenue(data: Iterable[Sale]) -> float:
     """Return total revenue across all sales."""
-    return round(sum(map(lambda s: s.revenue, data)), 2)
+    return round(sum(s.revenue for s in data), 2)
 
 
-def revenue_by_region(data: List[Sale]) -> Dict[str, float]:
+# The group-bys below accumulate into a defaultdict(float) on purpose. Updating
+# a NumPy accumulator one row at a time costs more per element than a dict
+# update in CPython. For array-level speedups use the pandas versions in
+# sales_frame.py.
+def revenue_by_region(data: Iterable[Sale]) -> Dict[str, float]:
     """Return total revenue grouped by region."""
     result = defaultdict(float)
     for s in data:
@@ -70,7 +124,7 @@ def revenue_by_region(data: List[Sale]) -> Dict[str, float]:
     return dict(result)
 
 
-def revenue_by_category(data: List[Sale]) -> Dict[str, float]:
+def revenue_by_category(data: Iterable[Sale]) -> Dict[str, float]:
     """Return total revenue grouped by product category."""
     result = defaultdict(float)
     for s in data:
@@ -78,25 +132,23 @@ def revenue_by_category(data: List[Sale]) -> Dict[str, float]:
     return dict(result)
 
 
-def top_n_products_by_revenue(data: List[Sale], n: int = 5) -> List[Tuple[str, float]]:
+def top_n_products_by_revenue(data: Iterable[Sale], n: int = 5) -> List[Tuple[str, float]]:
     """Return the top N products ranked by total revenue."""
     product_revenue = defaultdict(float)
     for s in data:
         product_revenue[s.product] += s.revenue
-    sorted_products = sorted(product_revenue.items(), key=lambda x: x[1], reverse=True)
-    return sorted_products[:n]
+    return heapq.nlargest(n, product_revenue.items(), key=itemgetter(1))
 
 
-def monthly_revenue_trend(data: List[Sale]) -> Dict[str, float]:
+def monthly_revenue_trend(data: Iterable[Sale]) -> Dict[str, float]:
     """Return total revenue for each month (formatted as YYYY-MM)."""
     monthly = defaultdict(float)
     for s in data:
-        key = s.date.strftime("%Y-%m")
-        monthly[key] += s.revenue
-    return dict(sorted(monthly.items()))
+        monthly[s.month_key] += s.revenue
+    return {_month_label(k): rev for k, rev in sorted(monthly.items())}
 
 
-def average_discount_by_category(data: List[Sale]) -> Dict[str, float]:
+def average_discount_by_category(data: Iterable[Sale]) -> Dict[str, float]:
     """Return the average discount value for each category."""
     sums = defaultdict(float)
     counts = defaultdict(int)
@@ -106,19 +158,54 @@ def average_discount_by_category(data: List[Sale]) -> Dict[str, float]:
     return {c: round(sums[c] / counts[c], 3) for c in sums}
 
 
-def highest_order_value(data: List[Sale]) -> Tuple[str, float]:
+def highest_order_value(data: Iterable[Sale]) -> Tuple[str, float]:
     """Return the order ID and value of the highest-value order."""
     order_values = defaultdict(float)
     for s in data:
         order_values[s.order_id] += s.revenue
-    order_id, value = max(order_values.items(), key=lambda x: x[1])
+    order_id, value = max(order_values.items(), key=itemgetter(1))
     return order_id, round(value, 2)
 
 
+# Single-pass report
+def full_report(data: Iterable[Sale], n: int = 5) -> SalesReport:
+    """Compute every report aggregate in one pass; data may be a one-shot iterator."""
+    total = 0.0
+    by_region = defaultdict(float)
+    by_category = defaultdict(float)
+    by_product = defaultdict(float)
+    monthly = defaultdict(float)
+    discount_sums = defaultdict(float)
+    counts = defaultdict(int)
+    order_values = defaultdict(float)
+    for s in data:
+        rev = s.revenue
+        total += rev
+        by_region[s.region] += rev
+        by_category[s.category] += rev
+        by_product[s.product] += rev
+        monthly[s.month_key] += rev
+        discount_sums[s.category] += s.discount
+        counts[s.category] += 1
+        order_values[s.order_id] += rev
+
+    top = heapq.nlargest(n, by_product.items(), key=itemgetter(1))
+    order_id, value = max(order_values.items(), key=itemgetter(1))
+    return SalesReport(
+        records=sum(counts.values()),
+        total_revenue=round(total, 2),
+        revenue_by_region=dict(by_region),
+        revenue_by_category=dict(by_category),
+        top_products=top,
+        monthly_trend={_month_label(k): rev for k, rev in sorted(monthly.items())},
+        average_discount={c: round(discount_sums[c] / counts[c], 3) for c in discount_sums},
+        highest_order=(order_id, round(value, 2)),
+    )
+
+
 # Visualization
-def plot_monthly_trend(data: List[Sale]):
-    """Plot monthly revenue trend using Matplotlib."""
-    trend = monthly_revenue_trend(data)
+def plot_monthly_trend(trend: Dict[str, float]):
+    """Plot a monthly revenue trend (as returned by monthly_revenue_trend) using Matplotlib."""
     months = list(trend.keys())
     revenues = list(trend.values())
 
@@ -134,35 +221,37 @@ def plot_monthly_trend(data: List[Sale]):
 
 
 # Report printer
-def print_report(csv_path: str):
-    """Read the CSV and print a formatted summary of all analyses."""
-    data = read_sales(csv_path)
+def print_report(csv_path: str) -> SalesReport:
+    """Read the CSV, print a formatted summary of all analyses and return the report."""
+    # Stream rows straight into the aggregators instead of building a list.
+    report = full_report(iter_sales(csv_path))
     print("\n=== SALES ANALYTICS REPORT ===")
-    print(f"Total Records: {len(data)}")
-    print(f"Total Revenue: ${total_revenue(data):,.2f}\n")
+    print(f"Total Records: {report.records}")
+    print(f"Total Revenue: ${report.total_revenue:,.2f}\n")
 
     print("Revenue by Region:")
-    for region, rev in revenue_by_region(data).items():
+    for region, rev in report.revenue_by_region.items():
         print(f"  {region:<10} ${rev:,.2f}")
 
     print("\nRevenue by Category:")
-    for category, rev in revenue_by_category(data).items():
+    for category, rev in report.revenue_by_category.items():
         print(f"  {category:<15} ${rev:,.2f}")
 
     print("\nTop 5 Products by Revenue:")
-    for product, rev in top_n_products_by_revenue(data, 5):
+    for product, rev in report.top_products:
         print(f"  {product:<15} ${rev:,.2f}")
 
     print("\nMonthly Revenue Trend:")
-    for month, rev in monthly_revenue_trend(data).items():
+    for month, rev in report.monthly_trend.items():
         print(f"  {month}: ${rev:,.2f}")
 
     print("\nAverage Discount by Category:")
-    for cat, avg in average_discount_by_category(data).items():
+    for cat, avg in report.average_discount.items():
         print(f"  {cat:<15} {avg:.2%}")
 
-    oid, value = highest_order_value(data)
+    oid, value = report.highest_order
     print(f"\nHighest Order Value: Order {oid} → ${value:,.2f}")
+    return report
 
 
 # Helper for file path
@@ -174,7 +263,5 @@ def default_csv_path() -> str:
 
 # Entry point
 if __name__ == "__main__":
-    csv_path = default_csv_path()
-    data = read_sales(csv_path)
-    print_report(csv_path)
-    plot_monthly_trend(data)
+    report = print_report(default_csv_path())
+    plot_monthly_trend(report.monthly_trend)
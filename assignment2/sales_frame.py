@@ -0,0 +1,138 @@
+"""
+Assignment 2 – Vectorized CSV Data Analysis with pandas
+
+This module offers the same analyses as `sales_analysis.py`, computed on a
+pandas DataFrame. Each column is stored as a contiguous NumPy array, so totals
+and group-bys run as compiled column operations instead of a Python loop over
+Sale objects. Results match the list-based functions.
+"""
+
+import heapq
+import os
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, List, Tuple
+import numpy as np
+import pandas as pd
+
+from assignment2.report import SalesReport
+
+
+# Reading the CSV file
+# Column types are fixed up front so the C parser converts each field directly
+# instead of inferring types. Prices and discounts stay float64 so totals match
+# the list-based analyses exactly.
+_DTYPES = {
+    "order_id": str,
+    "region": str,
+    "category": str,
+    "product": str,
+    "customer": str,
+    "quantity": np.int32,
+    "unit_price": np.float64,
+    "discount": np.float64,
+}
+
+
+@lru_cache(maxsize=4)
+def _load_sales_df(csv_path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Parse a CSV once per (path, mtime, size); a changed file gets a new entry."""
+    # keep_default_na=False keeps blank or "NA" text as the literal strings
+    # csv.reader yields, rather than NaN, which groupby would drop.
+    df = pd.read_csv(
+        csv_path, dtype=_DTYPES, parse_dates=["date"], date_format="%Y-%m-%d",
+        keep_default_na=False,
+    )
+    df["revenue"] = df["quantity"] * df["unit_price"] * (1 - df["discount"])
+    return df
+
+
+def read_sales_df(csv_path: str) -> pd.DataFrame:
+    """Load sales data from a CSV file into a DataFrame with a revenue column."""
+    st = os.stat(csv_path)
+    # Hand out a copy so callers can modify the frame without touching the cache.
+    return _load_sales_df(csv_path, st.st_mtime_ns, st.st_size).copy()
+
+
+# Analysis functions
+def total_revenue(df: pd.DataFrame) -> float:
+    """Return total revenue across all sales."""
+    return round(float(df["revenue"].sum()), 2)
+
+
+def revenue_by_region(df: pd.DataFrame) -> Dict[str, float]:
+    """Return total revenue grouped by region."""
+    return df.groupby("region", sort=False, dropna=False)["revenue"].sum().to_dict()
+
+
+def revenue_by_category(df: pd.DataFrame) -> Dict[str, float]:
+    """Return total revenue grouped by product category."""
+    return df.groupby("category", sort=False, dropna=False)["revenue"].sum().to_dict()
+
+
+def top_n_products_by_revenue(df: pd.DataFrame, n: int = 5) -> List[Tuple[str, float]]:
+    """Return the top N products ranked by total revenue."""
+    totals = df.groupby("product", sort=False, dropna=False)["revenue"].sum().nlargest(n)
+    return [(product, float(rev)) for product, rev in totals.items()]
+
+
+def monthly_revenue_trend(df: pd.DataFrame) -> Dict[str, float]:
+    """Return total revenue for each month (formatted as YYYY-MM)."""
+    monthly = df.groupby(df["date"].dt.to_period("M"))["revenue"].sum()
+    return {str(month): float(rev) for month, rev in monthly.items()}
+
+
+def average_discount_by_category(df: pd.DataFrame) -> Dict[str, float]:
+    """Return the average discount value for each category."""
+    means = df.groupby("category", sort=False, dropna=False)["discount"].mean()
+    return {c: round(float(avg), 3) for c, avg in means.items()}
+
+
+def highest_order_value(df: pd.DataFrame) -> Tuple[str, float]:
+    """Return the order ID and value of the highest-value order."""
+    order_values = df.groupby("order_id", sort=False, dropna=False)["revenue"].sum()
+    order_id = order_values.idxmax()
+    return order_id, round(float(order_values[order_id]), 2)
+
+
+# Single-pass report
+def full_report(df: pd.DataFrame, n: int = 5) -> SalesReport:
+    """Compute every report aggregate with one compiled sweep over the columns."""
+    # numba is only needed here, so the plain pandas functions work without it.
+    from assignment2._kernels import aggregate
+
+    if df.empty:
+        raise ValueError("full_report() needs at least one sale")
+    # Integer codes per group key; labels keep first-seen order like the dict-based
+    # versions, except months, which are sorted. use_na_sentinel=False gives missing
+    # keys their own code instead of -1, which the kernel would wrap to the last group.
+    region_id, regions = pd.factorize(df["region"], use_na_sentinel=False)
+    cat_id, categories = pd.factorize(df["category"], use_na_sentinel=False)
+    prod_id, products = pd.factorize(df["product"], use_na_sentinel=False)
+    month_id, months = pd.factorize(df["date"].dt.to_period("M"), sort=True)
+    order_id, orders = pd.factorize(df["order_id"], use_na_sentinel=False)
+    if (month_id < 0).any():
+        raise ValueError("full_report() needs a date on every sale")
+
+    (total, by_region, by_cat, by_prod, by_month,
+     disc_sums, counts, best, best_value) = aggregate(
+        df["quantity"].to_numpy(dtype="float64"),
+        df["unit_price"].to_numpy(dtype="float64"),
+        df["discount"].to_numpy(dtype="float64"),
+        region_id, cat_id, prod_id, month_id, order_id,
+        len(regions), len(categories), len(products), len(months), len(orders),
+    )
+
+    product_revenue = list(zip(products, by_prod.tolist()))
+    return SalesReport(
+        records=len(df),
+        total_revenue=round(float(total), 2),
+        revenue_by_region=dict(zip(regions, by_region.tolist())),
+        revenue_by_category=dict(zip(categories, by_cat.tolist())),
+        top_products=heapq.nlargest(n, product_revenue, key=itemgetter(1)),
+        monthly_trend=dict(zip(months.astype(str), by_month.tolist())),
+        average_discount={
+            c: round(d / k, 3) for c, d, k in zip(categories, disc_sums.tolist(), counts.tolist())
+        },
+        highest_order=(orders[best], round(float(best_value), 2)),
+    )
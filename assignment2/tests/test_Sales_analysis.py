@@ -1,8 +1,14 @@
+import os
+import shutil
+import tempfile
 import unittest
+from contextlib import redirect_stdout
+from datetime import datetime
+from io import StringIO
 from assignment2.sales_analysis import (
-    read_sales, total_revenue, revenue_by_region, revenue_by_category,
+    Sale, SalesReport, read_sales, iter_sales, total_revenue, revenue_by_region, revenue_by_category,
     top_n_products_by_revenue, monthly_revenue_trend,
-    average_discount_by_category, highest_order_value
+    average_discount_by_category, highest_order_value, full_report, print_report
 )
 
 CSV_PATH = "assignment2/data/sales.csv"
@@ -11,6 +17,24 @@ class TestSalesAnalysis(unittest.TestCase):
     def setUp(self):
         self.data = read_sales(CSV_PATH)
 
+    def test_read_sales_parses_fields(self):
+        first = self.data[0]
+        self.assertEqual(first.order_id, "O1")
+        self.assertEqual(first.date, datetime(2024, 1, 3))
+        self.assertEqual(first.quantity, 2)
+        self.assertEqual(first.month_key, 202401)
+        self.assertAlmostEqual(first.revenue, 2 * 1200 * 0.9)
+
+    def test_records_use_slots(self):
+        self.assertEqual(
+            Sale.__slots__,
+            ("order_id", "date", "region", "category", "product", "customer",
+             "quantity", "unit_price", "discount", "revenue", "month_key"),
+        )
+        self.assertFalse(hasattr(self.data[0], "__dict__"))
+        self.assertFalse(hasattr(full_report(self.data), "__dict__"))
+        self.assertIn("records", SalesReport.__slots__)
+
     def test_total_revenue(self):
         total = total_revenue(self.data)
         self.assertTrue(total > 0)
@@ -43,5 +67,59 @@ class TestSalesAnalysis(unittest.TestCase):
         self.assertTrue(oid.startswith("O"))
         self.assertTrue(val > 0)
 
+    def test_full_report_matches_individual_analyses(self):
+        report = full_report(self.data)
+        self.assertEqual(report.records, len(self.data))
+        self.assertEqual(report.total_revenue, total_revenue(self.data))
+        self.assertEqual(report.revenue_by_region, revenue_by_region(self.data))
+        self.assertEqual(report.revenue_by_category, revenue_by_category(self.data))
+        self.assertEqual(report.top_products, top_n_products_by_revenue(self.data, 5))
+        self.assertEqual(report.monthly_trend, monthly_revenue_trend(self.data))
+        self.assertEqual(report.average_discount, average_discount_by_category(self.data))
+        self.assertEqual(report.highest_order, highest_order_value(self.data))
+
+    def test_full_report_streams_from_iterator(self):
+        rows = iter_sales(CSV_PATH)
+        self.assertIs(iter(rows), rows)
+        self.assertEqual(full_report(rows), full_report(self.data))
+
+    def test_read_sales_skips_blank_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sales.csv")
+            with open(path, "w") as f:
+                f.write("order_id,date,region,category,product,customer,quantity,unit_price,discount\n")
+                f.write("O1,2024-01-03,North,Electronics,Laptop,Alice,2,1200,0.10\n")
+                f.write("\n")
+            sales = read_sales(path)
+            self.assertEqual(len(sales), 1)
+            self.assertEqual(sales[0].order_id, "O1")
+
+    def test_read_sales_returns_independent_records(self):
+        expected = total_revenue(read_sales(CSV_PATH))
+        read_sales(CSV_PATH)[0].revenue = 1e9
+        self.assertEqual(total_revenue(read_sales(CSV_PATH)), expected)
+
+    def test_read_sales_cache_tracks_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sales.csv")
+            shutil.copy(CSV_PATH, path)
+            first = read_sales(path)
+            again = read_sales(path)
+            self.assertEqual(again, first)
+            self.assertIsNot(again, first)
+
+            with open(path, "a") as f:
+                f.write("O999,2024-12-31,North,Office,Pen,Zed,1,5,0.00\n")
+            updated = read_sales(path)
+            self.assertEqual(len(updated), len(first) + 1)
+            self.assertEqual(updated[-1].order_id, "O999")
+
+    def test_print_report_returns_report(self):
+        out = StringIO()
+        with redirect_stdout(out):
+            report = print_report(CSV_PATH)
+        self.assertEqual(report, full_report(self.data))
+        self.assertIn("Total Records: 120", out.getvalue())
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import pandas as pd
+from assignment2 import sales_analysis, sales_frame
+
+CSV_PATH = "assignment2/data/sales.csv"
+
+# Group keys that pandas would read as NaN by default: a blank region and the
+# literal "NA" (e.g. North America) as both region and category.
+AWKWARD_CSV = """order_id,date,region,category,product,customer,quantity,unit_price,discount
+O1,2024-01-03,North,Electronics,Laptop,Alice,2,90,0.00
+O2,2024-01-05,,Electronics,Phone,Bob,1,50,0.00
+O3,2024-02-07,NA,NA,Chair,Carol,4,50,0.00
+O4,2024-02-09,South,Furniture,Chair,Dave,1,10,0.00
+O5,2024-03-11,EU,Furniture,Desk,Erin,3,60,0.10
+"""
+
+class TestSalesFrame(unittest.TestCase):
+    def setUp(self):
+        self.data = sales_analysis.read_sales(CSV_PATH)
+        self.df = sales_frame.read_sales_df(CSV_PATH)
+
+    def test_read_sales_df_column_types(self):
+        self.assertEqual(self.df["quantity"].dtype, "int32")
+        self.assertEqual(self.df["unit_price"].dtype, "float64")
+        self.assertEqual(self.df["discount"].dtype, "float64")
+        self.assertEqual(self.df["date"].dtype.kind, "M")
+        self.assertEqual(len(self.df), len(self.data))
+
+    def test_total_revenue_matches(self):
+        self.assertAlmostEqual(
+            sales_frame.total_revenue(self.df), sales_analysis.total_revenue(self.data), places=2
+        )
+
+    def test_groupings_match(self):
+        for name in ("revenue_by_region", "revenue_by_category", "monthly_revenue_trend"):
+            expected = getattr(sales_analysis, name)(self.data)
+            actual = getattr(sales_frame, name)(self.df)
+            self.assertEqual(list(actual), list(expected), name)
+            for key in expected:
+                self.assertAlmostEqual(actual[key], expected[key], places=6)
+
+    def test_top_products_match(self):
+        expected = sales_analysis.top_n_products_by_revenue(self.data, 5)
+        actual = sales_frame.top_n_products_by_revenue(self.df, 5)
+        self.assertEqual([p for p, _ in actual], [p for p, _ in expected])
+
+    def test_avg_discount_matches(self):
+        self.assertEqual(
+            sales_frame.average_discount_by_category(self.df),
+            sales_analysis.average_discount_by_category(self.data),
+        )
+
+    def test_highest_order_matches(self):
+        self.assertEqual(
+            sales_frame.highest_order_value(self.df), sales_analysis.highest_order_value(self.data)
+        )
+
+    def test_full_report_matches(self):
+        self.assertEqual(sales_frame.full_report(self.df), sales_analysis.full_report(self.data))
+
+    def test_blank_and_na_group_keys_match(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sales.csv")
+            with open(path, "w") as f:
+                f.write(AWKWARD_CSV)
+            data = sales_analysis.read_sales(path)
+            df = sales_frame.read_sales_df(path)
+        for name in ("revenue_by_region", "revenue_by_category", "average_discount_by_category"):
+            self.assertEqual(getattr(sales_frame, name)(df), getattr(sales_analysis, name)(data), name)
+        self.assertIn("", sales_frame.revenue_by_region(df))
+        self.assertIn("NA", sales_frame.revenue_by_region(df))
+        self.assertEqual(
+            sales_frame.top_n_products_by_revenue(df, 5),
+            sales_analysis.top_n_products_by_revenue(data, 5),
+        )
+        self.assertEqual(sales_frame.highest_order_value(df), sales_analysis.highest_order_value(data))
+
+    def test_full_report_blank_and_na_group_keys_match(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sales.csv")
+            with open(path, "w") as f:
+                f.write(AWKWARD_CSV)
+            data = sales_analysis.read_sales(path)
+            df = sales_frame.read_sales_df(path)
+        self.assertEqual(sales_frame.full_report(df), sales_analysis.full_report(data))
+
+    def test_full_report_keeps_missing_keys_separate(self):
+        df = self.df.head(3).copy()
+        df["region"] = ["North", None, "South"]
+        report = sales_frame.full_report(df)
+        expected = df["revenue"].tolist()
+        self.assertEqual(list(report.revenue_by_region.values()), expected)
+        self.assertEqual(list(report.revenue_by_region.values()),
+                         list(sales_frame.revenue_by_region(df).values()))
+
+    def test_import_does_not_need_numba_or_matplotlib(self):
+        code = (
+            "import sys, assignment2.sales_frame; "
+            "print('numba' in sys.modules, 'matplotlib' in sys.modules)"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.split(), ["False", "False"])
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)